@@ -0,0 +1,105 @@
+from datetime import date, datetime
+
+import pytest
+
+import cargui19
+from cargui19 import DATE_INPUT_FORMATS, EXCEL_COLUMNS, _cell_text, _format_date, load_and_clean_data
+
+
+HEADER = 'Department,Plate,Date,Start Time,Start_Mileage,End Time,End_Mileage,Destination,Driver'
+
+
+def write_csv(tmp_path, *lines):
+    path = tmp_path / 'trips.csv'
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def test_cell_text_integral_float_has_no_decimal():
+    assert _cell_text(12345.0) == '12345'
+    assert _cell_text(12.5) == '12.5'
+    assert _cell_text(None) == ''
+    assert _cell_text('  Hilo  ') == 'Hilo'
+
+
+def test_format_date_cells():
+    assert _format_date(datetime(2024, 3, 5, 14, 30)) == '03/05/2024'
+    assert _format_date(date(2024, 3, 5)) == '03/05/2024'
+
+
+@pytest.mark.parametrize('fmt', DATE_INPUT_FORMATS)
+def test_format_date_accepts_each_text_format(fmt):
+    assert _format_date(datetime(2024, 3, 5).strftime(fmt)) == '03/05/2024'
+
+
+@pytest.mark.parametrize('text', [
+    '3/5/2024 0:00',
+    '2024-03-05T08:00:00',
+    '2024-03-05 08:00',
+    '2024/03/05',
+])
+def test_format_date_accepts_excel_and_iso_datetimes(text):
+    assert _format_date(text) == '03/05/2024'
+
+
+def test_format_date_blank_stays_blank():
+    assert _format_date('') == ''
+    assert _format_date(None) == ''
+
+
+def test_format_date_unparseable_raises():
+    with pytest.raises(ValueError, match='next tuesday'):
+        _format_date('next tuesday')
+
+
+def test_load_csv_skips_blank_rows_and_pads_ragged_rows(tmp_path):
+    path = write_csv(
+        tmp_path,
+        HEADER + ',Notes',
+        'IT,ABC123,2024-03-05,08:00,100,09:00,120,"Hilo, HI",Bob,x',
+        ',,,,,,,,,',
+        '',
+        'HR,XYZ789,03/06/2024',
+    )
+    columns = load_and_clean_data(path)
+
+    assert list(columns) == EXCEL_COLUMNS
+    assert columns['Department'] == ['IT', 'HR']
+    assert columns['Date'] == ['03/05/2024', '03/06/2024']
+    assert columns['Destination'] == ['Hilo, HI', '']
+    assert columns['Driver'] == ['Bob', '']
+
+
+def test_load_csv_unparseable_date_names_the_row(tmp_path):
+    path = write_csv(
+        tmp_path,
+        HEADER,
+        'IT,ABC123,2024-03-05',
+        'HR,XYZ789,someday',
+    )
+    with pytest.raises(ValueError, match='Row 3'):
+        load_and_clean_data(path)
+
+
+def test_load_csv_missing_columns(tmp_path):
+    path = write_csv(tmp_path, 'Department,Plate', 'IT,ABC123')
+    with pytest.raises(ValueError, match='Missing required columns'):
+        load_and_clean_data(path)
+
+
+def test_load_xlsx_numbers_and_dates(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    path = str(tmp_path / 'trips.xlsx')
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(HEADER.split(','))
+    ws.append(['IT', 'ABC123', datetime(2024, 3, 5), '08:00', 100, '09:00', 120.0, 'Hilo', 'Bob'])
+    ws.append([None] * len(EXCEL_COLUMNS))
+    wb.save(path)
+
+    trips = list(cargui19.iter_trips(load_and_clean_data(path)))
+
+    assert len(trips) == 1
+    assert trips[0].Date == '03/05/2024'
+    assert trips[0].Start_Mileage == '100'
+    assert trips[0].End_Mileage == '120'